@@ -0,0 +1,76 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from accounts.models import Skill
+
+# --- Recommendation Cache ---
+# The version counter lives in the configured cache. With Django's default per-process
+# LocMemCache each worker keeps its own counter, so a change made in one process leaves
+# the others serving stale recommendations for up to RECOMMENDATIONS_TIMEOUT. Configure
+# a shared CACHES backend (e.g. Redis or Memcached) when running several workers.
+
+RECOMMENDATIONS_TIMEOUT = 300  # seconds
+RECOMMENDATIONS_VERSION_KEY = "recos:version"
+
+
+def get_recommendations_version():
+    """
+    Current generation of cached recommendations. A missing counter (culled or evicted)
+    is reseeded from the clock, never a constant, so keys from earlier generations
+    can't be served again.
+    """
+    return cache.get_or_set(RECOMMENDATIONS_VERSION_KEY, time.time_ns, None)
+
+
+def recommendations_cache_key(student_id, skill_ids):
+    """Cache key for a student's recommendations given their skill ids."""
+    skills_hash = hash(tuple(sorted(skill_ids)))
+    return f"recos:{get_recommendations_version()}:{student_id}:{skills_hash}"
+
+
+def invalidate_recommendations():
+    """
+    Bump the version so every cached recommendation list is ignored.
+    Old entries simply expire instead of being deleted one by one.
+    """
+    try:
+        cache.incr(RECOMMENDATIONS_VERSION_KEY)
+    except ValueError:
+        cache.set(RECOMMENDATIONS_VERSION_KEY, time.time_ns(), None)
+
+
+# --- Skill Catalog Cache ---
+
+ALL_SKILLS_KEY = "all_skills"
+ALL_SKILLS_TIMEOUT = 60 * 60  # seconds
+
+
+def get_all_skills():
+    """All skills ordered by name, as used by the dashboard filter."""
+    return cache.get_or_set(
+        ALL_SKILLS_KEY, lambda: list(Skill.objects.only('id', 'name').order_by('name')), ALL_SKILLS_TIMEOUT
+    )
+
+
+def invalidate_all_skills():
+    cache.delete(ALL_SKILLS_KEY)
+
+
+# --- Parsed Resume Cache ---
+
+RESUME_TIMEOUT = 60 * 60 * 24  # seconds
+
+
+def resume_digest(resume_file):
+    """Content hash of an uploaded resume, read chunk by chunk."""
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in resume_file.chunks():
+        digest.update(chunk)
+    resume_file.seek(0)
+    return digest.hexdigest()
+
+
+def resume_cache_key(digest):
+    """Cache key for the parsed data of a resume with the given content hash."""
+    return f"resume:{digest}"
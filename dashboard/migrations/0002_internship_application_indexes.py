@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-15 14:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('dashboard', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['student', '-applied_date'], name='dashboard_a_student_e1e46c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['-posted_date'], name='dashboard_i_posted__3ca4a6_idx'),
+        ),
+    ]
@@ -16,6 +16,11 @@ class Internship(models.Model):
     required_skills = models.ManyToManyField(Skill, related_name='internships')
     posted_date = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-posted_date']),
+        ]
+
     def __str__(self):
         return f"{self.title} at {self.company}"
 
@@ -34,6 +39,9 @@ class Application(models.Model):
     applied_date = models.DateTimeField(auto_now_add=True)
     class Meta:
         unique_together = ('student', 'internship')
+        indexes = [
+            models.Index(fields=['student', '-applied_date']),
+        ]
     def __str__(self):
         return f"{self.student.user.username}'s application for {self.internship.title}"
 
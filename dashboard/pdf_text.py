@@ -0,0 +1,12 @@
+import io
+
+import pdfplumber
+
+# Kept free of Django imports: process-pool workers started with spawn/forkserver
+# re-import this module and must not need a configured app registry.
+
+
+def extract_page_range(pdf_bytes, start, stop):
+    """Extract text from pages [start, stop) of a PDF"""
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return "\n".join(page.extract_text() or "" for page in pdf.pages[start:stop])
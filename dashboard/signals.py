@@ -0,0 +1,27 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from accounts.models import Skill
+from .caching import invalidate_all_skills, invalidate_recommendations
+from .models import Internship
+
+
+@receiver(post_save, sender=Internship)
+@receiver(post_delete, sender=Internship)
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def internship_catalog_changed(sender, **kwargs):
+    """Recommendations depend on every internship and skill name."""
+    invalidate_recommendations()
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def skill_catalog_changed(sender, **kwargs):
+    invalidate_all_skills()
+
+
+# A student's own skill changes don't need a receiver: their skill ids are part of the cache key
+@receiver(m2m_changed, sender=Internship.required_skills.through)
+def required_skills_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_recommendations()
@@ -1,5 +1,19 @@
 import json
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import pdfplumber
+try:
+    import pymupdf
+except ImportError:  # pdfplumber handles extraction on its own when PyMuPDF isn't installed
+    pymupdf = None
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Count, F, FloatField, Q
+from django.db.models.functions import Cast, Left, Lower
 from django.http import JsonResponse
 from django.shortcuts import render, get_object_or_404, redirect
 from django.views.decorators.csrf import csrf_exempt
@@ -8,6 +22,57 @@ from django.contrib import messages
 from accounts.models import Student, Skill
 from .models import Internship, Application, QuizQuestion, InterviewQuestion, RecommendedProject
 from .ai import get_ai_generated_questions
+from .pdf_text import extract_page_range
+from .caching import (
+    RECOMMENDATIONS_TIMEOUT, RESUME_TIMEOUT, get_all_skills, invalidate_all_skills,
+    recommendations_cache_key, resume_cache_key, resume_digest
+)
+
+# Patterns used by the resume extractors, compiled once at import time
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RES = tuple(re.compile(pattern) for pattern in (
+    r'\+?1?[-\s]?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}',
+    r'\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}',
+    r'\d{3}[-\s]?\d{3}[-\s]?\d{4}'
+))
+_YEAR_RE = re.compile(r'\d{4}')
+
+# PDFs with more pages than this are extracted in parallel when pdfplumber does the work
+_PARALLEL_PAGE_THRESHOLD = 20
+_MAX_PDF_WORKERS = 4
+
+def _keyword_re(*keywords):
+    """Compile keywords into one alternation that matches them as substrings of a lowercased line"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+_NAME_SKIP_RE = _keyword_re('resume', 'cv', 'curriculum', 'vitae', 'email', 'phone', 'address', 'linkedin')
+_SUMMARY_RE = _keyword_re("summary", "objective", "profile", "about")
+_EXP_RE = _keyword_re("experience", "work", "employment", "career", "professional", "internship")
+_EXP_STOP_RE = _keyword_re("education", "skills", "projects", "certifications")
+_JOB_TITLE_RE = _keyword_re("intern", "developer", "engineer", "analyst", "manager")
+_EDU_RE = _keyword_re("education", "degree", "university", "college", "school", "academic")
+_EDU_STOP_RE = _keyword_re("experience", "skills", "projects")
+_DEGREE_RE = _keyword_re("bachelor", "master", "phd", "degree", "university", "college")
+_SKILL_HDR_RE = _keyword_re("skills", "technologies", "tools", "programming", "technical", "software", "languages")
+_PROJ_RE = _keyword_re("projects", "portfolio", "work")
+
+# Separators between skills listed on one line
+_SKILL_DELIMITER_RE = re.compile(r'[,•·|;/\n\t]')
+
+# Common technical skills to look for anywhere in a resume
+_COMMON_SKILLS = frozenset({
+    'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js', 'django', 'flask',
+    'html', 'css', 'sql', 'mongodb', 'postgresql', 'mysql', 'git', 'docker', 'kubernetes',
+    'aws', 'azure', 'gcp', 'machine learning', 'data analysis', 'pandas', 'numpy', 'tensorflow',
+    'pytorch', 'scikit-learn', 'r', 'matlab', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
+    'swift', 'kotlin', 'flutter', 'react native', 'bootstrap', 'tailwind', 'sass', 'less',
+    'webpack', 'babel', 'typescript', 'graphql', 'rest api', 'microservices', 'agile', 'scrum'
+})
+
+INTERNSHIPS_PER_PAGE = 25
+
+# Characters of the description loaded for internship cards (rendered as 20 words)
+_DESCRIPTION_PREVIEW_LENGTH = 300
 
 # --- Page Rendering Views ---
 
@@ -20,17 +85,26 @@ def dashboard(request):
     student_profile, created = Student.objects.get_or_create(user=request.user)
     
     # Fetch all internship objects, ordered by the most recently posted.
-    internships = Internship.objects.all().order_by('-posted_date')
-    
-    # Get recommended internships based on student skills
-    recommended_internships = get_recommended_internships(student_profile)
+    # Cards only show a short description, so the full text column is left in the database.
+    internships = (
+        Internship.objects
+        .only('title', 'company', 'location', 'stipend', 'posted_date', 'duration')
+        .annotate(description_preview=Left('description', _DESCRIPTION_PREVIEW_LENGTH))
+        .prefetch_related('required_skills')
+        .order_by('-posted_date')
+    )
+    page_obj = Paginator(internships, INTERNSHIPS_PER_PAGE).get_page(request.GET.get('page'))
+    
+    # Ids of recommended internships, used to badge cards (no internship rows are loaded)
+    recommended_ids = {internship_id for internship_id, _, _ in get_recommendation_rows(student_profile)}
     
     # Get all skills for filter
-    all_skills = Skill.objects.all()
+    all_skills = get_all_skills()
     
     context = {
-        'internships': internships,
-        'recommended_internships': recommended_internships,
+        'internships': page_obj,
+        'page_obj': page_obj,
+        'recommended_ids': recommended_ids,
         'all_skills': all_skills,
         'student': student_profile
     }
@@ -41,42 +115,105 @@ def dashboard(request):
 
 def get_recommended_internships(student):
     """
-    Get internships that match student's skills with improved matching
+    Get internships that match student's skills, served from the cache when possible
+    """
+    return _hydrate_recommendations(get_recommendation_rows(student))
+
+def get_recommendation_rows(student):
+    """
+    Ranked (internship_id, matching_skill_ids, match_percentage) tuples for a student.
+    Callers that only show a page of results should paginate these before hydrating.
     """
-    if not student.skills.exists():
+    skill_ids = list(student.skills.values_list('id', flat=True))
+    if not skill_ids:
         return []
     
-    student_skills = student.skills.all()
-    recommended = []
+    cache_key = recommendations_cache_key(student.id, skill_ids)
+    rows = cache.get(cache_key)
+    if rows is None:
+        rows = _compute_recommendation_rows(student)
+        cache.set(cache_key, rows, RECOMMENDATIONS_TIMEOUT)
+    return rows
+
+def _hydrate_recommendations(rows):
+    """
+    Build recommendation dicts from (internship_id, matching_skill_ids, match_percentage) tuples
+    """
+    internships = Internship.objects.filter(
+        id__in=[internship_id for internship_id, _, _ in rows]
+    ).prefetch_related('required_skills').in_bulk()
     
-    for internship in Internship.objects.all():
-        required_skills = internship.required_skills.all()
-        if not required_skills.exists():
+    recommended = []
+    for internship_id, matching_skill_ids, match_percentage in rows:
+        internship = internships.get(internship_id)
+        if internship is None:
             continue
-            
-        # Improved skill matching (case-insensitive and partial matching)
-        matching_skills = []
-        for req_skill in required_skills:
-            for student_skill in student_skills:
-                if (req_skill.name.lower() == student_skill.name.lower() or 
-                    req_skill.name.lower() in student_skill.name.lower() or
-                    student_skill.name.lower() in req_skill.name.lower()):
-                    matching_skills.append(req_skill)
-                    break
-        
-        if matching_skills:
-            match_percentage = (len(matching_skills) / required_skills.count()) * 100
-            if match_percentage >= 25:  # At least 25% match
-                recommended.append({
-                    'internship': internship,
-                    'matching_skills': matching_skills,
-                    'match_percentage': round(match_percentage, 1)
-                })
-    
-    # Sort by match percentage
-    recommended.sort(key=lambda x: x['match_percentage'], reverse=True)
+        matching_ids = set(matching_skill_ids)
+        recommended.append({
+            'internship': internship,
+            'matching_skills': [skill for skill in internship.required_skills.all() if skill.id in matching_ids],
+            'match_percentage': match_percentage
+        })
     return recommended
 
+def _compute_recommendation_rows(student):
+    """
+    Rank internships that match student's skills with improved matching
+    """
+    # Resolve partial (case-insensitive) name matches once against the skills internships
+    # actually require, so the database only has to count required skills within that id set
+    student_skill_names = {name.lower() for name in student.skills.values_list('name', flat=True)}
+    required_skills = Skill.objects.filter(internships__isnull=False).distinct().only('id', 'name')
+    matched_skills = _match_skills(required_skills, student_skill_names)
+    matched_skill_ids = {skill.id for skill in matched_skills}
+    if not matched_skill_ids:
+        return []
+    
+    ranked = (
+        Internship.objects
+        .values('id')  # Group by id alone rather than every internship column
+        .annotate(
+            required_total=Count('required_skills', distinct=True),
+            matched_total=Count('required_skills', filter=Q(required_skills__in=matched_skill_ids), distinct=True),
+        )
+        .filter(matched_total__gt=0, required_total__lte=F('matched_total') * 4)  # At least 25% match
+        .annotate(match_percentage=Cast('matched_total', FloatField()) * 100 / Cast('required_total', FloatField()))
+        .order_by('-match_percentage', 'id')
+        .values_list('id', 'match_percentage')
+    )
+    
+    # Only ids are needed here; internships are loaded later, one page at a time
+    matching_skill_ids = defaultdict(list)
+    for internship_id, skill_id in Internship.required_skills.through.objects.filter(
+        skill_id__in=matched_skill_ids
+    ).values_list('internship_id', 'skill_id'):
+        matching_skill_ids[internship_id].append(skill_id)
+    
+    return [
+        (internship_id, matching_skill_ids[internship_id], round(match_percentage, 1))
+        for internship_id, match_percentage in ranked
+    ]
+
+def _match_skills(required_skills, student_skill_names):
+    """
+    Return the required skills matched by a set of lowercased student skill names.
+    A skill matches exactly, or partially when one name contains the other.
+    """
+    required_names = [(req_skill, req_skill.name.lower()) for req_skill in required_skills]
+    required_lower = {req_lower for _, req_lower in required_names}
+    
+    # Exact matches in one set intersection; the substring pass only sees the names left over
+    matched_names = required_lower & student_skill_names
+    # One joined string is a cheap gate: a required name absent from it can't be inside any
+    # student name. A hit may span the separator, so it is confirmed name by name.
+    joined_names = "|".join(student_skill_names)
+    for req_lower in required_lower - matched_names:
+        if ((req_lower in joined_names and any(req_lower in name for name in student_skill_names)) or
+            any(name in req_lower for name in student_skill_names)):
+            matched_names.add(req_lower)
+    
+    return [req_skill for req_skill, req_lower in required_names if req_lower in matched_names]
+
 
 
 # --- API Views ---
@@ -86,30 +223,100 @@ def parse_resume_with_pdfplumber(resume_file):
     Parse resume PDF using pdfplumber to extract text and structure it.
     """
     try:
-        with pdfplumber.open(resume_file) as pdf:
-            text = ""
-            for page in pdf.pages:
-                text += page.extract_text() or ""
+        text = extract_pdf_text(resume_file)
         
         # Basic parsing logic - in production, you'd use more sophisticated NLP
         lines = [line.strip() for line in text.split('\n') if line.strip()]
         
-        # Extract basic information
-        parsed_data = {
-            "contact_info": extract_contact_info(lines),
-            "summary": extract_summary(lines),
-            "experience": extract_experience(lines),
-            "education": extract_education(lines),
-            "skills": extract_skills(lines),
-            "projects": extract_projects(lines),
-            "raw_text": text
-        }
+        parsed_data = _parse_lines(lines)
+        parsed_data["raw_text"] = text
         
         return parsed_data
     except Exception as e:
         print(f"Error parsing resume: {e}")
         return None
 
+def extract_pdf_text(resume_file):
+    """
+    Extract raw text from a resume PDF (path or file-like). PyMuPDF's C-level extractor
+    is used when available, with pdfplumber as the fallback for files it can't read.
+    """
+    if pymupdf is not None:
+        try:
+            if isinstance(resume_file, str):
+                doc = pymupdf.open(resume_file)
+            else:
+                doc = pymupdf.open(stream=resume_file.read(), filetype="pdf")
+                resume_file.seek(0)
+            with doc:
+                return "\n".join(page.get_text("text") for page in doc)
+        except Exception as e:
+            print(f"PyMuPDF could not read resume, falling back to pdfplumber: {e}")
+            if not isinstance(resume_file, str):
+                resume_file.seek(0)
+    
+    with pdfplumber.open(resume_file) as pdf:
+        page_count = len(pdf.pages)
+        if page_count <= _PARALLEL_PAGE_THRESHOLD:
+            return "\n".join(page.extract_text() or "" for page in pdf.pages)
+    
+    # Long PDFs: pdfplumber's layout code holds the GIL, so split page ranges across processes
+    if isinstance(resume_file, str):
+        with open(resume_file, 'rb') as f:
+            pdf_bytes = f.read()
+    else:
+        resume_file.seek(0)
+        pdf_bytes = resume_file.read()
+        resume_file.seek(0)
+    
+    workers = min(_MAX_PDF_WORKERS, os.cpu_count() or 1)
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            texts = executor.map(
+                extract_page_range, [pdf_bytes] * len(starts), starts, [start + step for start in starts]
+            )
+            return "\n".join(texts)
+    except (BrokenProcessPool, OSError) as e:
+        # A pool failure shouldn't reject a valid PDF; extract it in this process instead
+        print(f"PDF worker pool failed, extracting resume sequentially: {e}")
+        return extract_page_range(pdf_bytes, 0, page_count)
+
+def _parse_lines(lines):
+    """Extract basic information from resume lines, classifying section headers in one pass"""
+    sections = _index_sections(lines)
+    return {
+        "contact_info": extract_contact_info(lines),
+        "summary": extract_summary(lines, sections),
+        "experience": extract_experience(lines, sections),
+        "education": extract_education(lines, sections),
+        "skills": extract_skills(lines, sections),
+        "projects": extract_projects(lines, sections),
+    }
+
+def _index_sections(lines):
+    """
+    Walk the resume once and record, per extractor, the indices of lines that
+    look like its section header. A line may head several sections (e.g. "Work").
+    """
+    sections = {"summary": [], "experience": [], "education": [], "skills": [], "projects": []}
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        line_lower = line_clean.lower()
+        is_short = len(line_clean) < 50
+        if _SUMMARY_RE.search(line_lower):
+            sections["summary"].append(i)
+        if is_short and _EXP_RE.search(line_lower):
+            sections["experience"].append(i)
+        if is_short and _EDU_RE.search(line_lower):
+            sections["education"].append(i)
+        if _SKILL_HDR_RE.search(line_lower):
+            sections["skills"].append(i)
+        if _PROJ_RE.search(line_lower):
+            sections["projects"].append(i)
+    return sections
+
 def extract_contact_info(lines):
     """Extract contact information from resume lines"""
     contact_info = {"name": "", "email": "", "phone": "", "linkedin": ""}
@@ -120,8 +327,7 @@ def extract_contact_info(lines):
         
         # Email detection
         if "@" in line_clean and "." in line_clean and not contact_info["email"]:
-            import re
-            email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', line_clean)
+            email_match = _EMAIL_RE.search(line_clean)
             if email_match:
                 contact_info["email"] = email_match.group()
         
@@ -131,14 +337,8 @@ def extract_contact_info(lines):
         
         # Phone detection
         elif not contact_info["phone"]:
-            import re
-            phone_patterns = [
-                r'\+?1?[-\s]?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}',
-                r'\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}',
-                r'\d{3}[-\s]?\d{3}[-\s]?\d{4}'
-            ]
-            for pattern in phone_patterns:
-                phone_match = re.search(pattern, line_clean)
+            for phone_re in _PHONE_RES:
+                phone_match = phone_re.search(line_clean)
                 if phone_match:
                     contact_info["phone"] = phone_match.group()
                     break
@@ -146,9 +346,8 @@ def extract_contact_info(lines):
         # Name detection - look for lines that are likely names
         if not contact_info["name"] and i < 5:
             # Skip lines that are clearly not names
-            skip_keywords = ['resume', 'cv', 'curriculum', 'vitae', 'email', 'phone', 'address', 'linkedin']
             if (len(line_clean.split()) <= 4 and 
-                not any(keyword in line_lower for keyword in skip_keywords) and
+                not _NAME_SKIP_RE.search(line_lower) and
                 not any(char.isdigit() for char in line_clean) and
                 not "@" in line_clean and
                 len(line_clean) > 3):
@@ -156,167 +355,149 @@ def extract_contact_info(lines):
     
     return contact_info
 
-def extract_summary(lines):
+def extract_summary(lines, sections=None):
     """Extract summary/objective from resume"""
-    summary_keywords = ["summary", "objective", "profile", "about"]
-    for i, line in enumerate(lines):
-        if any(keyword in line.lower() for keyword in summary_keywords):
-            # Return next few lines as summary
-            return " ".join(lines[i+1:i+4])
+    if sections is None:
+        sections = _index_sections(lines)
+    for i in sections['summary']:
+        # Return next few lines as summary
+        return " ".join(lines[i+1:i+4])
     return ""
 
-def extract_experience(lines):
+def extract_experience(lines, sections=None):
     """Extract work experience from resume with better parsing"""
+    if sections is None:
+        sections = _index_sections(lines)
     experience = []
-    exp_keywords = ["experience", "work", "employment", "career", "professional", "internship"]
     
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        if any(keyword in line_lower for keyword in exp_keywords) and len(line.strip()) < 50:
-            # Look for experience entries in the following lines
-            j = i + 1
-            current_exp = None
+    for i in sections['experience']:
+        # Look for experience entries in the following lines
+        j = i + 1
+        current_exp = None
+        
+        while j < len(lines) and j < i + 15:
+            current_line = lines[j].strip()
+            if not current_line:
+                j += 1
+                continue
+            current_lower = current_line.lower()
             
-            while j < len(lines) and j < i + 15:
-                current_line = lines[j].strip()
-                if not current_line:
-                    j += 1
-                    continue
-                
-                # Stop if we hit another major section
-                if any(section in current_line.lower() for section in ["education", "skills", "projects", "certifications"]):
-                    break
-                
-                # Look for job titles (usually shorter lines, may contain dates)
-                if len(current_line) < 100 and (any(char.isdigit() for char in current_line) or 
-                                               any(word in current_line.lower() for word in ["intern", "developer", "engineer", "analyst", "manager"])):
-                    if current_exp:
-                        experience.append(current_exp)
-                    
-                    current_exp = {
-                        "title": current_line,
-                        "company": "",
-                        "description": ""
-                    }
-                    
-                    # Look for company name in next line
-                    if j + 1 < len(lines) and lines[j + 1].strip():
-                        next_line = lines[j + 1].strip()
-                        if len(next_line) < 80 and not next_line.startswith("•"):
-                            current_exp["company"] = next_line
-                            j += 1
+            # Stop if we hit another major section
+            if _EXP_STOP_RE.search(current_lower):
+                break
+            
+            # Look for job titles (usually shorter lines, may contain dates)
+            if len(current_line) < 100 and (any(char.isdigit() for char in current_line) or 
+                                           _JOB_TITLE_RE.search(current_lower)):
+                if current_exp:
+                    experience.append(current_exp)
                 
-                # Collect description lines
-                elif current_exp and (current_line.startswith("•") or current_line.startswith("-") or len(current_line) > 50):
-                    if current_exp["description"]:
-                        current_exp["description"] += " " + current_line
-                    else:
-                        current_exp["description"] = current_line
+                current_exp = {
+                    "title": current_line,
+                    "company": "",
+                    "description": []  # Joined into a string once all lines are collected
+                }
                 
-                j += 1
+                # Look for company name in next line
+                if j + 1 < len(lines) and lines[j + 1].strip():
+                    next_line = lines[j + 1].strip()
+                    if len(next_line) < 80 and not next_line.startswith("•"):
+                        current_exp["company"] = next_line
+                        j += 1
             
-            if current_exp:
-                experience.append(current_exp)
-            break
+            # Collect description lines
+            elif current_exp and (current_line.startswith("•") or current_line.startswith("-") or len(current_line) > 50):
+                current_exp["description"].append(current_line)
+            
+            j += 1
+        
+        if current_exp:
+            experience.append(current_exp)
+        break
     
-    return experience[:5]  # Limit to 5 experiences
+    experience = experience[:5]  # Limit to 5 experiences
+    for exp in experience:
+        exp["description"] = " ".join(exp["description"])
+    return experience
 
-def extract_education(lines):
+def extract_education(lines, sections=None):
     """Extract education information from resume with better parsing"""
+    if sections is None:
+        sections = _index_sections(lines)
     education = []
-    edu_keywords = ["education", "degree", "university", "college", "school", "academic"]
     
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        if any(keyword in line_lower for keyword in edu_keywords) and len(line.strip()) < 50:
-            # Look for education entries
-            j = i + 1
-            current_edu = None
+    for i in sections['education']:
+        # Look for education entries
+        j = i + 1
+        current_edu = None
+        
+        while j < len(lines) and j < i + 10:
+            current_line = lines[j].strip()
+            if not current_line:
+                j += 1
+                continue
+            current_lower = current_line.lower()
             
-            while j < len(lines) and j < i + 10:
-                current_line = lines[j].strip()
-                if not current_line:
-                    j += 1
-                    continue
-                
-                # Stop if we hit another section
-                if any(section in current_line.lower() for section in ["experience", "skills", "projects"]):
-                    break
-                
-                # Look for degree or institution
-                if len(current_line) < 100:
-                    if any(degree in current_line.lower() for degree in ["bachelor", "master", "phd", "degree", "university", "college"]):
-                        if current_edu:
-                            education.append(current_edu)
-                        
-                        current_edu = {
-                            "degree": current_line,
-                            "institution": "",
-                            "dates": ""
-                        }
-                        
-                        # Look for institution in next line
-                        if j + 1 < len(lines) and lines[j + 1].strip():
-                            next_line = lines[j + 1].strip()
-                            if len(next_line) < 80:
-                                current_edu["institution"] = next_line
-                                j += 1
+            # Stop if we hit another section
+            if _EDU_STOP_RE.search(current_lower):
+                break
+            
+            # Look for degree or institution
+            if len(current_line) < 100:
+                if _DEGREE_RE.search(current_lower):
+                    if current_edu:
+                        education.append(current_edu)
+                    
+                    current_edu = {
+                        "degree": current_line,
+                        "institution": "",
+                        "dates": ""
+                    }
                     
-                    # Look for dates
-                    elif current_edu and any(char.isdigit() for char in current_line):
-                        import re
-                        if re.search(r'\d{4}', current_line):
-                            current_edu["dates"] = current_line
+                    # Look for institution in next line
+                    if j + 1 < len(lines) and lines[j + 1].strip():
+                        next_line = lines[j + 1].strip()
+                        if len(next_line) < 80:
+                            current_edu["institution"] = next_line
+                            j += 1
                 
-                j += 1
+                # Look for dates
+                elif current_edu and any(char.isdigit() for char in current_line):
+                    if _YEAR_RE.search(current_line):
+                        current_edu["dates"] = current_line
             
-            if current_edu:
-                education.append(current_edu)
-            break
+            j += 1
+        
+        if current_edu:
+            education.append(current_edu)
+        break
     
     return education[:3]  # Limit to 3 education entries
 
-def extract_skills(lines):
+def extract_skills(lines, sections=None):
     """Extract skills from resume with improved accuracy"""
+    if sections is None:
+        sections = _index_sections(lines)
     skills = []
-    skill_keywords = ["skills", "technologies", "tools", "programming", "technical", "software", "languages"]
-    
-    # Common technical skills to look for
-    common_skills = {
-        'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js', 'django', 'flask',
-        'html', 'css', 'sql', 'mongodb', 'postgresql', 'mysql', 'git', 'docker', 'kubernetes',
-        'aws', 'azure', 'gcp', 'machine learning', 'data analysis', 'pandas', 'numpy', 'tensorflow',
-        'pytorch', 'scikit-learn', 'r', 'matlab', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-        'swift', 'kotlin', 'flutter', 'react native', 'bootstrap', 'tailwind', 'sass', 'less',
-        'webpack', 'babel', 'typescript', 'graphql', 'rest api', 'microservices', 'agile', 'scrum'
-    }
     
     # First, look for dedicated skills sections
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        if any(keyword in line_lower for keyword in skill_keywords):
-            # Look for skills in next several lines
-            for j in range(i+1, min(i+8, len(lines))):
-                if lines[j] and not lines[j].lower().startswith(("experience", "education", "projects")):
-                    # Split by various delimiters
-                    delimiters = [',', '•', '·', '|', ';', '/', '\n', '\t']
-                    line_text = lines[j]
-                    for delimiter in delimiters:
-                        line_text = line_text.replace(delimiter, '|')
-                    
-                    line_skills = [s.strip() for s in line_text.split('|') if s.strip()]
-                    
-                    for skill in line_skills:
-                        skill_clean = skill.lower().strip()
-                        if len(skill_clean) > 1 and len(skill_clean) < 30:
-                            skills.append(skill.strip())
-                    break
+    for i in sections['skills']:
+        # Look for skills in next several lines
+        for j in range(i+1, min(i+8, len(lines))):
+            if lines[j] and not lines[j].lower().startswith(("experience", "education", "projects")):
+                # Split by various delimiters
+                line_skills = [s.strip() for s in _SKILL_DELIMITER_RE.split(lines[j]) if s.strip()]
+                
+                for skill in line_skills:
+                    skill_clean = skill.lower().strip()
+                    if len(skill_clean) > 1 and len(skill_clean) < 30:
+                        skills.append(skill.strip())
+                break
     
     # Also scan entire document for common technical skills
     full_text = ' '.join(lines).lower()
-    for skill in common_skills:
-        if skill in full_text and skill.title() not in skills:
-            skills.append(skill.title())
+    found = {skill.title() for skill in _COMMON_SKILLS if skill in full_text}
+    skills.extend(sorted(found.difference(skills)))
     
     # Clean and deduplicate skills
     cleaned_skills = []
@@ -329,20 +510,20 @@ def extract_skills(lines):
     
     return cleaned_skills[:20]  # Limit to 20 skills
 
-def extract_projects(lines):
+def extract_projects(lines, sections=None):
     """Extract projects from resume"""
+    if sections is None:
+        sections = _index_sections(lines)
     projects = []
-    proj_keywords = ["projects", "portfolio", "work"]
     
-    for i, line in enumerate(lines):
-        if any(keyword in line.lower() for keyword in proj_keywords):
-            for j in range(i+1, min(i+8, len(lines))):
-                if lines[j] and not lines[j].lower().startswith(("experience", "education", "skills")):
-                    projects.append({
-                        "title": lines[j],
-                        "description": " ".join(lines[j+1:j+3]) if j+1 < len(lines) else ""
-                    })
-                    break
+    for i in sections['projects']:
+        for j in range(i+1, min(i+8, len(lines))):
+            if lines[j] and not lines[j].lower().startswith(("experience", "education", "skills")):
+                projects.append({
+                    "title": lines[j],
+                    "description": " ".join(lines[j+1:j+3]) if j+1 < len(lines) else ""
+                })
+                break
     
     return projects
 
@@ -367,53 +548,73 @@ def upload_resume_api_view(request):
             student = Student.objects.create(user=request.user)
         
         resume_file = request.FILES['resume']
-
-        # Delete old resume file if exists
-        if student.resume:
-            try:
-                student.resume.delete()
-            except:
-                pass
-
-        # 1. Save the original resume file to the 'resume' field
-        student.resume = resume_file
-        student.save()  # Save first to get the file path
-        
-        # 2. Call the function to parse the resume
-        parsed_data = parse_resume_with_pdfplumber(student.resume.path)
+        resume_key = resume_cache_key(resume_digest(resume_file))
+
+        # 1. Parse the uploaded file in memory, reusing the result for identical files
+        parsed_data = cache.get(resume_key)
+        if parsed_data is None:
+            parsed_data = parse_resume_with_pdfplumber(resume_file)
+            resume_file.seek(0)  # Rewind for the storage backend
+            if parsed_data:
+                cache.set(resume_key, parsed_data, RESUME_TIMEOUT)
         
         if not parsed_data:
             return JsonResponse({'error': 'Failed to parse resume. Please ensure it is a valid PDF.'}, status=400)
 
-        # 3. Save the structured JSON to the 'resume_json_data' field
-        student.resume_json_data = parsed_data
-        
-        # Clear existing skills and add new ones
-        student.skills.clear()
-        
-        # Auto-create skills from parsed resume
-        if 'skills' in parsed_data and parsed_data['skills']:
-            for skill_name in parsed_data['skills']:
-                if skill_name and len(skill_name.strip()) > 1:
-                    skill, created = Skill.objects.get_or_create(
-                        name__iexact=skill_name.strip(),
-                        defaults={'name': skill_name.strip().title()}
-                    )
-                    student.skills.add(skill)
-        
-        student.save()
+        old_resume_name = student.resume.name if student.resume else None
+
+        # 2. Save the resume file, structured JSON and skills in a single transaction
+        with transaction.atomic():
+            student.resume = resume_file
+            student.resume_json_data = parsed_data
+            student.save()
+            
+            # Replace existing skills with the ones auto-created from the parsed resume
+            skills = _get_or_create_skills(parsed_data.get('skills') or [])
+            student.skills.set(skills)
+
+        # Delete old resume file only once the new one is committed
+        if old_resume_name:
+            try:
+                student.resume.storage.delete(old_resume_name)
+            except:
+                pass
 
         return JsonResponse({
             'status': 'success',
             'message': 'Resume uploaded and parsed successfully!',
             'data': parsed_data,
-            'skills_count': student.skills.count()
+            'skills_count': len(skills)
         })
 
     except Exception as e:
         print(f"An error occurred in upload_resume_api_view: {e}")
         return JsonResponse({'error': f'An internal server error occurred: {str(e)}'}, status=500)
 
+def _get_or_create_skills(skill_names):
+    """
+    Resolve skill names case-insensitively to Skill objects, creating the missing ones
+    in a single bulk insert instead of one get_or_create per name.
+    """
+    names_by_lower = {}
+    for skill_name in skill_names:
+        if skill_name and len(skill_name.strip()) > 1:
+            names_by_lower.setdefault(skill_name.strip().lower(), skill_name.strip().title())
+    if not names_by_lower:
+        return []
+    
+    skills = {
+        skill.name_lower: skill
+        for skill in Skill.objects.annotate(name_lower=Lower('name')).filter(name_lower__in=names_by_lower)
+    }
+    missing = [name for lower, name in names_by_lower.items() if lower not in skills]
+    if missing:
+        Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True)
+        invalidate_all_skills()  # bulk_create doesn't send post_save
+        # Re-read so the new rows have primary keys on every backend
+        skills.update((skill.name.lower(), skill) for skill in Skill.objects.filter(name__in=missing))
+    return list(skills.values())
+
 @login_required
 def resume_upload(request):
     """
@@ -436,7 +637,13 @@ def my_applications(request):
     Display student's applications
     """
     student_profile, created = Student.objects.get_or_create(user=request.user)
-    applications = Application.objects.filter(student=student_profile).order_by('-applied_date')
+    applications = (
+        Application.objects
+        .filter(student=student_profile)
+        .select_related('internship')
+        .prefetch_related('internship__required_skills')
+        .order_by('-applied_date')
+    )
     
     return render(request, 'dashboard/my_applications.html', {
         'applications': applications,
@@ -449,10 +656,13 @@ def recommended_internships(request):
     Display recommended internships based on student skills
     """
     student_profile, created = Student.objects.get_or_create(user=request.user)
-    recommended = get_recommended_internships(student_profile)
+    # Paginate the cached id tuples so only the shown page of internships is loaded
+    page_obj = Paginator(get_recommendation_rows(student_profile), INTERNSHIPS_PER_PAGE).get_page(request.GET.get('page'))
+    page_obj.object_list = _hydrate_recommendations(page_obj.object_list)
     
     return render(request, 'dashboard/recommended_internships.html', {
-        'internships': recommended,
+        'internships': page_obj,
+        'page_obj': page_obj,
         'student': student_profile
     })
 
@@ -488,8 +698,8 @@ def recommended_internships(request):
 
 @login_required
 def practice_quiz(request, internship_id):
-    internship = get_object_or_404(Internship, id=internship_id)
-    quiz_questions = internship.quiz_questions.all()
+    internship = get_object_or_404(Internship.objects.only('title'), id=internship_id)
+    quiz_questions = internship.quiz_questions.only('question_text', 'options')
     context = {
         'internship': internship,
         'quiz_questions': quiz_questions
@@ -498,8 +708,8 @@ def practice_quiz(request, internship_id):
 
 @login_required
 def coding_challenges(request, internship_id):
-    internship = get_object_or_404(Internship, id=internship_id)
-    coding_questions = internship.coding_questions.all()
+    internship = get_object_or_404(Internship.objects.only('title'), id=internship_id)
+    coding_questions = internship.coding_questions.only('title', 'problem_statement')
     context = {
         'internship': internship,
         'coding_questions': coding_questions
@@ -508,7 +718,7 @@ def coding_challenges(request, internship_id):
 
 @login_required
 def interview_questions(request, internship_id):
-    internship = get_object_or_404(Internship, id=internship_id)
+    internship = get_object_or_404(Internship.objects.only('title'), id=internship_id)
     interview_questions = internship.interview_questions.all()
     context = {
         'internship': internship,
@@ -529,21 +739,13 @@ def internship_detail(request, internship_id):
     has_applied = Application.objects.filter(student=student_profile, internship=internship).exists()
     
     # Get matching skills
-    student_skills = student_profile.skills.all()
-    matching_skills = []
-    required_skills = internship.required_skills.all()
-    
-    for req_skill in required_skills:
-        for student_skill in student_skills:
-            if (req_skill.name.lower() == student_skill.name.lower() or 
-                req_skill.name.lower() in student_skill.name.lower() or
-                student_skill.name.lower() in req_skill.name.lower()):
-                matching_skills.append(req_skill)
-                break
+    student_skill_names = {name.lower() for name in student_profile.skills.values_list('name', flat=True)}
+    required_skills = list(internship.required_skills.all())
+    matching_skills = _match_skills(required_skills, student_skill_names)
     
     match_percentage = 0
-    if required_skills.exists():
-         match_percentage = (len(matching_skills) / required_skills.count()) * 100
+    if required_skills:
+         match_percentage = (len(matching_skills) / len(required_skills)) * 100
 
     context = {
         'internship': internship,
@@ -566,13 +768,12 @@ def apply_internship(request, internship_id):
     
 
 
-    # Check if already applied
-    if Application.objects.filter(student=student_profile, internship=internship).exists():
-        messages.warning(request, f'You have already applied for {internship.title} at {internship.company}!')
-    else:
-        # Create application
-        Application.objects.create(student=student_profile, internship=internship)
+    # Create the application unless one already exists (unique per student and internship)
+    application, created = Application.objects.get_or_create(student=student_profile, internship=internship)
+    if created:
         messages.success(request, f'Successfully applied for {internship.title} at {internship.company}!')
+    else:
+        messages.warning(request, f'You have already applied for {internship.title} at {internship.company}!')
     
     return redirect('internship_detail', internship_id=internship_id)
 